@@ -1,12 +1,28 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import inspect
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from functools import wraps
-from urllib.parse import urlencode
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any, NamedTuple
+from urllib.parse import quote
 
 import garth
 from mcp.server.fastmcp import FastMCP
 
 
+if TYPE_CHECKING:
+    from garth.data._base import Data
+    from garth.stats._base import Stats
+
+
 __version__ = "0.0.10"
 
 # Type alias for functions that return data from garth.connectapi
@@ -14,6 +30,10 @@ ConnectAPIResponse = str | dict | list | int | float | bool | None
 
 server = FastMCP("Garth - Garmin Connect", dependencies=["garth"])
 
+# Shared pool for tools that fan out several Garmin Connect requests
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="garth-mcp")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
 # Tool filtering configuration
 _ENABLED_TOOLS_ENV = os.getenv("GARTH_ENABLED_TOOLS")
 _DISABLED_TOOLS_ENV = os.getenv("GARTH_DISABLED_TOOLS")
@@ -50,17 +70,106 @@ def filtered_tool():
 
 
 def requires_garth_session(func):
+    """
+    Check for a Garth token and run the blocking tool body in a worker thread,
+    so a slow Garmin Connect request doesn't stall the server's event loop.
+    """
+
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        token = os.getenv("GARTH_TOKEN")
-        if not token:
+    async def wrapper(*args, **kwargs):
+        if not os.getenv("GARTH_TOKEN"):
             return "You must set the GARTH_TOKEN environment variable to use this tool"
-        garth.client.loads(token)
-        return func(*args, **kwargs)
+        return await asyncio.to_thread(func, *args, **kwargs)
 
     return wrapper
 
 
+# One Garth client per worker thread: garth.Client.request keeps each response
+# on self.last_resp, so concurrent requests can't safely share a client
+_thread_clients = threading.local()
+
+
+def _thread_client() -> garth.Client:
+    """Get this thread's Garth client, loaded with the current GARTH_TOKEN."""
+    token = os.environ["GARTH_TOKEN"]
+    if getattr(_thread_clients, "token", None) != token:
+        _thread_clients.client = garth.Client()
+        _thread_clients.client.loads(token)
+        _thread_clients.token = token
+    return _thread_clients.client
+
+
+def _connectapi(endpoint: str) -> ConnectAPIResponse:
+    """Get a Garmin Connect API endpoint using this thread's Garth client."""
+    return _thread_client().connectapi(endpoint)
+
+
+class _Entry:
+    """Cached tool response and the monotonic time it expires at."""
+
+    __slots__ = ("expiry", "payload")
+
+    def __init__(self, expiry: float, payload: ConnectAPIResponse):
+        self.expiry = expiry
+        self.payload = payload
+
+
+# Responses of idempotent GET tools, keyed on tool, arguments and token.
+# A max size of 0 or less disables the cache.
+_RESPONSE_CACHE: OrderedDict[tuple, _Entry] = OrderedDict()
+_RESPONSE_CACHE_MAXSIZE = int(os.getenv("GARTH_CACHE_MAX", "256"))
+
+# Past activities don't change, so they can be cached for a day
+_ACTIVITY_TTL = 24 * 60 * 60
+
+
+def ttl_cached(ttl: float = 600):
+    """Decorator that caches a tool's response for ttl seconds."""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            token = os.getenv("GARTH_TOKEN")
+            if not token or _RESPONSE_CACHE_MAXSIZE <= 0:
+                return await func(*args, **kwargs)
+            key = (func.__name__, args, tuple(sorted(kwargs.items())), hash(token))
+            now = time.monotonic()
+            entry = _RESPONSE_CACHE.get(key)
+            if entry is not None and entry.expiry > now:
+                _RESPONSE_CACHE.move_to_end(key)
+                return entry.payload
+            result = await func(*args, **kwargs)
+            _RESPONSE_CACHE[key] = _Entry(now + ttl, result)
+            _RESPONSE_CACHE.move_to_end(key)
+            while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAXSIZE:
+                _RESPONSE_CACHE.popitem(last=False)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# Profile data changes rarely, so it's cached per token for up to this many
+# seconds. A TTL of 0 or less disables the cache.
+_PROFILE_TTL = int(os.getenv("GARTH_PROFILE_TTL", "300"))
+
+
+def _profile_cache_key() -> tuple[int, int]:
+    """Key profile caches on the current token and TTL time bucket."""
+    return hash(os.getenv("GARTH_TOKEN")), int(time.monotonic() // _PROFILE_TTL)
+
+
+@lru_cache(maxsize=8)
+def _cached_user_profile(token_hash: int, epoch: int) -> garth.UserProfile:
+    return garth.UserProfile.get(client=_thread_client())
+
+
+@lru_cache(maxsize=8)
+def _cached_user_settings(token_hash: int, epoch: int) -> garth.UserSettings:
+    return garth.UserSettings.get(client=_thread_client())
+
+
 # Tools using Garth data classes
 
 
@@ -70,7 +179,9 @@ def user_profile() -> str | garth.UserProfile:
     """
     Get user profile information using Garth's UserProfile data class.
     """
-    return garth.UserProfile.get()
+    if _PROFILE_TTL <= 0:
+        return garth.UserProfile.get(client=_thread_client())
+    return _cached_user_profile(*_profile_cache_key())
 
 
 @filtered_tool()
@@ -79,112 +190,328 @@ def user_settings() -> str | garth.UserSettings:
     """
     Get user settings using Garth's UserSettings data class.
     """
-    return garth.UserSettings.get()
+    if _PROFILE_TTL <= 0:
+        return garth.UserSettings.get(client=_thread_client())
+    return _cached_user_settings(*_profile_cache_key())
 
 
-@filtered_tool()
-@requires_garth_session
-def weekly_intensity_minutes(
-    end_date: date | None = None, weeks: int = 1
-) -> str | list[garth.WeeklyIntensityMinutes]:
-    """
-    Get weekly intensity minutes data for a given date and number of weeks.
-    If no date is provided, the current date will be used.
-    If no weeks are provided, 1 week will be used.
-    """
-    return garth.WeeklyIntensityMinutes.list(end_date, weeks)
-
+class _ListTool(NamedTuple):
+    """A tool that lists a Garth data class over a number of days or weeks."""
 
-@filtered_tool()
-@requires_garth_session
-def daily_body_battery(
-    end_date: date | None = None, days: int = 1
-) -> str | list[garth.DailyBodyBatteryStress]:
-    """
-    Get daily body battery data for a given date and number of days.
-    If no date is provided, the current date will be used.
-    If no days are provided, 1 day will be used.
-    """
-    return garth.DailyBodyBatteryStress.list(end_date, days)
+    name: str
+    data_class: type[Stats | Data | garth.DailyHRV]
+    period: str
+    description: str
 
 
-@filtered_tool()
-@requires_garth_session
-def daily_hydration(
-    end_date: date | None = None, days: int = 1
-) -> str | list[garth.DailyHydration]:
-    """
-    Get daily hydration data for a given date and number of days.
-    If no date is provided, the current date will be used.
-    If no days are provided, 1 day will be used.
-    """
-    return garth.DailyHydration.list(end_date, days)
+def _register_list_tool(spec: _ListTool) -> None:
+    period = spec.period
 
+    def tool(**kwargs):
+        return spec.data_class.list(
+            kwargs["end_date"], kwargs[period], client=_thread_client()
+        )
 
-@filtered_tool()
-@requires_garth_session
-def daily_steps(
-    end_date: date | None = None, days: int = 1
-) -> str | list[garth.DailySteps]:
-    """
-    Get daily steps data for a given date and number of days.
+    tool.__name__ = tool.__qualname__ = spec.name
+    tool.__doc__ = f"""
+    Get {spec.description} for a given date and number of {period}.
     If no date is provided, the current date will be used.
-    If no days are provided, 1 day will be used.
-    """
-    return garth.DailySteps.list(end_date, days)
+    If no {period} are provided, 1 {period.removesuffix("s")} will be used.
+    """
+    params = [
+        inspect.Parameter(
+            "end_date",
+            inspect.Parameter.KEYWORD_ONLY,
+            default=None,
+            annotation=date | None,
+        ),
+        inspect.Parameter(
+            period, inspect.Parameter.KEYWORD_ONLY, default=1, annotation=int
+        ),
+    ]
+    tool.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        params,
+        return_annotation=str | list[spec.data_class],  # type: ignore[name-defined]
+    )
+    filtered_tool()(requires_garth_session(tool))
+
+
+_LIST_TOOLS = (
+    _ListTool(
+        "weekly_intensity_minutes",
+        data_class=garth.WeeklyIntensityMinutes,
+        period="weeks",
+        description="weekly intensity minutes data",
+    ),
+    _ListTool(
+        "daily_body_battery",
+        data_class=garth.DailyBodyBatteryStress,
+        period="days",
+        description="daily body battery data",
+    ),
+    _ListTool(
+        "daily_hydration",
+        data_class=garth.DailyHydration,
+        period="days",
+        description="daily hydration data",
+    ),
+    _ListTool(
+        "daily_steps",
+        data_class=garth.DailySteps,
+        period="days",
+        description="daily steps data",
+    ),
+    _ListTool(
+        "weekly_steps",
+        data_class=garth.WeeklySteps,
+        period="weeks",
+        description="weekly steps data",
+    ),
+    _ListTool(
+        "daily_hrv",
+        data_class=garth.DailyHRV,
+        period="days",
+        description="daily heart rate variability data",
+    ),
+    _ListTool(
+        "hrv_data",
+        data_class=garth.HRVData,
+        period="days",
+        description="detailed HRV data",
+    ),
+    _ListTool(
+        "daily_sleep",
+        data_class=garth.DailySleep,
+        period="days",
+        description="daily sleep summary data",
+    ),
+    _ListTool(
+        "daily_stress",
+        data_class=garth.DailyStress,
+        period="days",
+        description="daily stress data",
+    ),
+    _ListTool(
+        "weekly_stress",
+        data_class=garth.WeeklyStress,
+        period="weeks",
+        description="weekly stress data",
+    ),
+    _ListTool(
+        "daily_intensity_minutes",
+        data_class=garth.DailyIntensityMinutes,
+        period="days",
+        description="daily intensity minutes data",
+    ),
+)
+
+for _list_tool in _LIST_TOOLS:
+    _register_list_tool(_list_tool)
+del _list_tool
+
+
+# List methods of the daily data classes that daily_multi can fetch together
+_DAILY_DOMAINS: dict[str, Callable[..., list]] = {
+    "sleep": garth.DailySleep.list,
+    "stress": garth.DailyStress.list,
+    "hrv": garth.DailyHRV.list,
+    "steps": garth.DailySteps.list,
+    "body_battery": garth.DailyBodyBatteryStress.list,
+    "hydration": garth.DailyHydration.list,
+    "intensity_minutes": garth.DailyIntensityMinutes.list,
+}
+
+
+def _fetch_daily(domain: str, end_date: date | None, days: int) -> list:
+    return _DAILY_DOMAINS[domain](end_date, days, client=_thread_client())
 
 
 @filtered_tool()
 @requires_garth_session
-def weekly_steps(
-    end_date: date | None = None, weeks: int = 1
-) -> str | list[garth.WeeklySteps]:
-    """
-    Get weekly steps data for a given date and number of weeks.
+def daily_multi(
+    domains: list[str], end_date: date | None = None, days: int = 1
+) -> str | dict[str, list]:
+    """
+    Get daily data for several domains at once for a given date and number of
+    days. The domains are fetched concurrently.
+    domains: Any of sleep, stress, hrv, steps, body_battery, hydration,
+    intensity_minutes
     If no date is provided, the current date will be used.
-    If no weeks are provided, 1 week will be used.
+    If no days are provided, 1 day will be used.
     """
-    return garth.WeeklySteps.list(end_date, weeks)
+    unknown = [d for d in domains if d not in _DAILY_DOMAINS]
+    if unknown:
+        return (
+            f"Unknown domains: {', '.join(unknown)}. "
+            f"Valid domains are: {', '.join(_DAILY_DOMAINS)}"
+        )
+    futures = {
+        domain: _EXECUTOR.submit(_fetch_daily, domain, end_date, days)
+        for domain in domains
+    }
+    return {domain: future.result() for domain, future in futures.items()}
 
 
-@filtered_tool()
-@requires_garth_session
-def daily_hrv(
-    end_date: date | None = None, days: int = 1
-) -> str | list[garth.DailyHRV]:
-    """
-    Get daily heart rate variability data for a given date and number of days.
-    If no date is provided, the current date will be used.
-    If no days are provided, 1 day will be used.
-    """
-    return garth.DailyHRV.list(end_date, days)
+# Tools using direct API calls
 
 
-@filtered_tool()
-@requires_garth_session
-def hrv_data(end_date: date | None = None, days: int = 1) -> str | list[garth.HRVData]:
-    """
-    Get detailed HRV data for a given date and number of days.
-    If no date is provided, the current date will be used.
-    If no days are provided, 1 day will be used.
-    """
-    return garth.HRVData.list(end_date, days)
+class _APITool(NamedTuple):
+    """A tool that gets an endpoint formatted from the tool's arguments."""
 
+    name: str
+    endpoint: str
+    params: dict[str, Any]
+    description: str
+    ttl: float | None = None
 
-@filtered_tool()
-@requires_garth_session
-def daily_sleep(
-    end_date: date | None = None, days: int = 1
-) -> str | list[garth.DailySleep]:
-    """
-    Get daily sleep summary data for a given date and number of days.
-    If no date is provided, the current date will be used.
-    If no days are provided, 1 day will be used.
-    """
-    return garth.DailySleep.list(end_date, days)
 
+def _register_api_tool(spec: _APITool) -> None:
+    def tool(**kwargs):
+        return _connectapi(spec.endpoint.format(**kwargs))
 
-# Tools using direct API calls
+    tool.__name__ = tool.__qualname__ = spec.name
+    tool.__doc__ = spec.description
+    tool.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        [
+            inspect.Parameter(
+                param, inspect.Parameter.KEYWORD_ONLY, annotation=annotation
+            )
+            for param, annotation in spec.params.items()
+        ],
+        return_annotation=ConnectAPIResponse,
+    )
+    registered = requires_garth_session(tool)
+    if spec.ttl is not None:
+        registered = ttl_cached(spec.ttl)(registered)
+    filtered_tool()(registered)
+
+
+_API_TOOLS = (
+    _APITool(
+        "get_activities_by_date",
+        endpoint="wellness-service/wellness/dailySummaryChart/{date}",
+        params={"date": str},
+        ttl=300,
+        description=(
+            "Get activities for a specific date from Garmin Connect.\n"
+            "date: Date for activities (YYYY-MM-DD format)"
+        ),
+    ),
+    _APITool(
+        "get_activity_details",
+        endpoint="activity-service/activity/{activity_id}",
+        params={"activity_id": str},
+        ttl=_ACTIVITY_TTL,
+        description=(
+            "Get detailed information for a specific activity.\n"
+            "activity_id: Garmin Connect activity ID"
+        ),
+    ),
+    _APITool(
+        "get_activity_splits",
+        endpoint="activity-service/activity/{activity_id}/splits",
+        params={"activity_id": str},
+        ttl=_ACTIVITY_TTL,
+        description=(
+            "Get lap/split data for a specific activity.\n"
+            "activity_id: Garmin Connect activity ID"
+        ),
+    ),
+    _APITool(
+        "get_activity_weather",
+        endpoint="activity-service/activity/{activity_id}/weather",
+        params={"activity_id": str},
+        ttl=_ACTIVITY_TTL,
+        description=(
+            "Get weather data for a specific activity.\n"
+            "activity_id: Garmin Connect activity ID"
+        ),
+    ),
+    _APITool(
+        "get_respiration_data",
+        endpoint="wellness-service/wellness/dailyRespiration/{date}",
+        params={"date": str},
+        ttl=600,
+        description=(
+            "Get respiration data from Garmin Connect.\n"
+            "date: Date for respiration data (YYYY-MM-DD format)"
+        ),
+    ),
+    _APITool(
+        "get_spo2_data",
+        endpoint="wellness-service/wellness/dailyPulseOx/{date}",
+        params={"date": str},
+        ttl=600,
+        description=(
+            "Get SpO2 (blood oxygen) data from Garmin Connect.\n"
+            "date: Date for SpO2 data (YYYY-MM-DD format)"
+        ),
+    ),
+    _APITool(
+        "get_blood_pressure",
+        endpoint="wellness-service/wellness/dailyBloodPressure/{date}",
+        params={"date": str},
+        ttl=600,
+        description=(
+            "Get blood pressure readings from Garmin Connect.\n"
+            "date: Date for blood pressure data (YYYY-MM-DD format)"
+        ),
+    ),
+    _APITool(
+        "get_devices",
+        endpoint="device-service/deviceregistration/devices",
+        params={},
+        ttl=300,
+        description="Get connected devices from Garmin Connect.",
+    ),
+    _APITool(
+        "get_device_settings",
+        endpoint="device-service/deviceservice/device-info/settings/{device_id}",
+        params={"device_id": str},
+        ttl=300,
+        description=(
+            "Get settings for a specific device.\n"
+            "device_id: Device ID from Garmin Connect"
+        ),
+    ),
+    _APITool(
+        "get_gear",
+        endpoint="gear-service/gear",
+        params={},
+        ttl=300,
+        description="Get gear information from Garmin Connect.",
+    ),
+    _APITool(
+        "get_gear_stats",
+        endpoint="gear-service/gear/stats/{gear_uuid}",
+        params={"gear_uuid": str},
+        description=(
+            "Get usage statistics for specific gear.\ngear_uuid: UUID of the gear item"
+        ),
+    ),
+    _APITool(
+        "monthly_activity_summary",
+        endpoint="mobile-gateway/calendar/year/{year}/month/{month}",
+        params={"month": int, "year": int},
+        ttl=600,
+        description="Get the monthly activity summary for a given month and year.",
+    ),
+    _APITool(
+        "snapshot",
+        endpoint="mobile-gateway/snapshot/detail/v2/{from_date}/{to_date}",
+        params={"from_date": date, "to_date": date},
+        description=(
+            "Get the snapshot for a given date range. This is a good starting\n"
+            "point for getting data for a given date range. It can be used in\n"
+            "combination with the get_connectapi_endpoint tool to get data from\n"
+            "any Garmin Connect API endpoint."
+        ),
+    ),
+)
+
+for _api_tool in _API_TOOLS:
+    _register_api_tool(_api_tool)
+del _api_tool
 
 
 @filtered_tool()
@@ -197,56 +524,36 @@ def get_activities(
     start_date: Start date for activities (YYYY-MM-DD format)
     limit: Maximum number of activities to return
     """
-    params = {}
+    params = []
     if start_date:
-        params["startDate"] = start_date
+        params.append(f"startDate={quote(start_date, safe='')}")
     if limit:
-        params["limit"] = str(limit)
+        params.append(f"limit={limit}")
 
     endpoint = "activitylist-service/activities/search/activities"
     if params:
-        endpoint += "?" + urlencode(params)
-    return garth.connectapi(endpoint)
+        endpoint += "?" + "&".join(params)
+    return _connectapi(endpoint)
 
 
 @filtered_tool()
+@ttl_cached(ttl=_ACTIVITY_TTL)
 @requires_garth_session
-def get_activities_by_date(date: str) -> ConnectAPIResponse:
-    """
-    Get activities for a specific date from Garmin Connect.
-    date: Date for activities (YYYY-MM-DD format)
+def get_activity_bundle(activity_id: str) -> str | dict[str, ConnectAPIResponse]:
     """
-    return garth.connectapi(f"wellness-service/wellness/dailySummaryChart/{date}")
-
-
-@filtered_tool()
-@requires_garth_session
-def get_activity_details(activity_id: str) -> ConnectAPIResponse:
-    """
-    Get detailed information for a specific activity.
+    Get details, lap/split data and weather for a specific activity in one call.
+    The three requests are made concurrently.
     activity_id: Garmin Connect activity ID
     """
-    return garth.connectapi(f"activity-service/activity/{activity_id}")
-
-
-@filtered_tool()
-@requires_garth_session
-def get_activity_splits(activity_id: str) -> ConnectAPIResponse:
-    """
-    Get lap/split data for a specific activity.
-    activity_id: Garmin Connect activity ID
-    """
-    return garth.connectapi(f"activity-service/activity/{activity_id}/splits")
-
-
-@filtered_tool()
-@requires_garth_session
-def get_activity_weather(activity_id: str) -> ConnectAPIResponse:
-    """
-    Get weather data for a specific activity.
-    activity_id: Garmin Connect activity ID
-    """
-    return garth.connectapi(f"activity-service/activity/{activity_id}/weather")
+    endpoint = f"activity-service/activity/{activity_id}"
+    details = _EXECUTOR.submit(_connectapi, endpoint)
+    splits = _EXECUTOR.submit(_connectapi, f"{endpoint}/splits")
+    weather = _EXECUTOR.submit(_connectapi, f"{endpoint}/weather")
+    return {
+        "details": details.result(),
+        "splits": splits.result(),
+        "weather": weather.result(),
+    }
 
 
 @filtered_tool()
@@ -260,77 +567,7 @@ def get_body_composition(date: str | None = None) -> ConnectAPIResponse:
         endpoint = f"wellness-service/wellness/bodyComposition/{date}"
     else:
         endpoint = "wellness-service/wellness/bodyComposition"
-    return garth.connectapi(endpoint)
-
-
-@filtered_tool()
-@requires_garth_session
-def get_respiration_data(date: str) -> ConnectAPIResponse:
-    """
-    Get respiration data from Garmin Connect.
-    date: Date for respiration data (YYYY-MM-DD format)
-    """
-    return garth.connectapi(f"wellness-service/wellness/dailyRespiration/{date}")
-
-
-@filtered_tool()
-@requires_garth_session
-def get_spo2_data(date: str) -> ConnectAPIResponse:
-    """
-    Get SpO2 (blood oxygen) data from Garmin Connect.
-    date: Date for SpO2 data (YYYY-MM-DD format)
-    """
-    return garth.connectapi(f"wellness-service/wellness/dailyPulseOx/{date}")
-
-
-@filtered_tool()
-@requires_garth_session
-def get_blood_pressure(date: str) -> ConnectAPIResponse:
-    """
-    Get blood pressure readings from Garmin Connect.
-    date: Date for blood pressure data (YYYY-MM-DD format)
-    """
-    return garth.connectapi(f"wellness-service/wellness/dailyBloodPressure/{date}")
-
-
-@filtered_tool()
-@requires_garth_session
-def get_devices() -> ConnectAPIResponse:
-    """
-    Get connected devices from Garmin Connect.
-    """
-    return garth.connectapi("device-service/deviceregistration/devices")
-
-
-@filtered_tool()
-@requires_garth_session
-def get_device_settings(device_id: str) -> ConnectAPIResponse:
-    """
-    Get settings for a specific device.
-    device_id: Device ID from Garmin Connect
-    """
-    return garth.connectapi(
-        f"device-service/deviceservice/device-info/settings/{device_id}"
-    )
-
-
-@filtered_tool()
-@requires_garth_session
-def get_gear() -> ConnectAPIResponse:
-    """
-    Get gear information from Garmin Connect.
-    """
-    return garth.connectapi("gear-service/gear")
-
-
-@filtered_tool()
-@requires_garth_session
-def get_gear_stats(gear_uuid: str) -> ConnectAPIResponse:
-    """
-    Get usage statistics for specific gear.
-    gear_uuid: UUID of the gear item
-    """
-    return garth.connectapi(f"gear-service/gear/stats/{gear_uuid}")
+    return _connectapi(endpoint)
 
 
 @filtered_tool()
@@ -340,7 +577,7 @@ def get_connectapi_endpoint(endpoint: str) -> ConnectAPIResponse:
     Get the data from a given Garmin Connect API endpoint.
     This is a generic tool that can be used to get data from any Garmin Connect API endpoint.
     """
-    return garth.connectapi(endpoint)
+    return _connectapi(endpoint)
 
 
 @filtered_tool()
@@ -355,74 +592,13 @@ def nightly_sleep(
     sleep_movement provides detailed sleep movement data. If looking at
     multiple nights, it'll be a lot of data.
     """
-    sleep_data = garth.SleepData.list(end_date, nights)
+    sleep_data = garth.SleepData.list(end_date, nights, client=_thread_client())
     if not sleep_movement:
         for night in sleep_data:
-            if hasattr(night, "sleep_movement"):
-                del night.sleep_movement
+            night.sleep_movement = None
     return sleep_data
 
 
-@filtered_tool()
-@requires_garth_session
-def daily_stress(
-    end_date: date | None = None, days: int = 1
-) -> str | list[garth.DailyStress]:
-    """
-    Get daily stress data for a given date and number of days.
-    If no date is provided, the current date will be used.
-    If no days are provided, 1 day will be used.
-    """
-    return garth.DailyStress.list(end_date, days)
-
-
-@filtered_tool()
-@requires_garth_session
-def weekly_stress(
-    end_date: date | None = None, weeks: int = 1
-) -> str | list[garth.WeeklyStress]:
-    """
-    Get weekly stress data for a given date and number of weeks.
-    If no date is provided, the current date will be used.
-    If no weeks are provided, 1 week will be used.
-    """
-    return garth.WeeklyStress.list(end_date, weeks)
-
-
-@filtered_tool()
-@requires_garth_session
-def daily_intensity_minutes(
-    end_date: date | None = None, days: int = 1
-) -> str | list[garth.DailyIntensityMinutes]:
-    """
-    Get daily intensity minutes data for a given date and number of days.
-    If no date is provided, the current date will be used.
-    If no days are provided, 1 day will be used.
-    """
-    return garth.DailyIntensityMinutes.list(end_date, days)
-
-
-@filtered_tool()
-@requires_garth_session
-def monthly_activity_summary(month: int, year: int) -> ConnectAPIResponse:
-    """
-    Get the monthly activity summary for a given month and year.
-    """
-    return garth.connectapi(f"mobile-gateway/calendar/year/{year}/month/{month}")
-
-
-@filtered_tool()
-@requires_garth_session
-def snapshot(from_date: date, to_date: date) -> ConnectAPIResponse:
-    """
-    Get the snapshot for a given date range. This is a good starting point for
-    getting data for a given date range. It can be used in combination with
-    the get_connectapi_endpoint tool to get data from any Garmin Connect API
-    endpoint.
-    """
-    return garth.connectapi(f"mobile-gateway/snapshot/detail/v2/{from_date}/{to_date}")
-
-
 def main():
     server.run()
 